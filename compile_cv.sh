@@ -2,8 +2,24 @@
 
 # Script to compile LaTeX CV and clean auxiliary files
 # Usage: ./compile_cv.sh [clean]
+# Set FORCE=1 to recompile even if the source has not changed.
 
 CV_FILE="Mehdi_Raza_Software_Engineer.tex"
+PDF_FILE="${CV_FILE%.tex}.pdf"
+LOG_FILE="${CV_FILE%.tex}.log"
+HASH_FILE=".${CV_FILE%.tex}.sha1"
+MAX_PASSES=3
+
+# Hash a file with whichever checksum tool is available
+file_hash() {
+    if command -v sha1sum > /dev/null 2>&1; then
+        sha1sum "$1" | cut -d ' ' -f 1
+    elif command -v shasum > /dev/null 2>&1; then
+        shasum "$1" | cut -d ' ' -f 1
+    else
+        cksum "$1" | cut -d ' ' -f 1,2
+    fi
+}
 
 # Colors for output
 GREEN='\033[0;32m'
@@ -15,14 +31,48 @@ echo -e "${YELLOW}Compiling LaTeX documents...${NC}"
 
 # Compile CV
 if [ -f "$CV_FILE" ]; then
-    echo -e "${GREEN}Compiling $CV_FILE...${NC}"
-    pdflatex -interaction=nonstopmode -halt-on-error "$CV_FILE" > /dev/null 2>&1
-    
-    if [ $? -eq 0 ]; then
-        echo -e "${GREEN}✓ CV compiled successfully${NC}"
+    # Skip pdflatex when the source is identical to the last successful build
+    # and the PDF hasn't been rewritten since (e.g. by a manual pdflatex run)
+    CV_HASH=$(file_hash "$CV_FILE")
+
+    if [ "$FORCE" != 1 ] && [ -n "$CV_HASH" ] && [ -f "$PDF_FILE" ] && ! [ "$PDF_FILE" -nt "$HASH_FILE" ] \
+        && [ "$CV_HASH" == "$(cat "$HASH_FILE" 2>/dev/null)" ]; then
+        echo -e "${GREEN}✓ $CV_FILE unchanged, reusing $PDF_FILE${NC}"
     else
-        echo -e "${RED}✗ Error compiling CV${NC}"
-        exit 1
+        echo -e "${GREEN}Compiling $CV_FILE...${NC}"
+        # Remove the previous log so a failure can't report a stale error, and
+        # the stamp so only a finished, successful build can mark the PDF current
+        rm -f "$LOG_FILE" "$HASH_FILE"
+        pdflatex -interaction=nonstopmode -halt-on-error "$CV_FILE" > /dev/null 2>&1
+        STATUS=$?
+        PASS=1
+
+        # Only rerun when LaTeX reports unresolved references or outlines
+        while [ $STATUS -eq 0 ] && [ $PASS -lt $MAX_PASSES ] && grep -q "Rerun to get" "$LOG_FILE"; do
+            PASS=$((PASS + 1))
+            echo -e "${YELLOW}Rerunning pdflatex (pass $PASS)...${NC}"
+            pdflatex -interaction=nonstopmode -halt-on-error "$CV_FILE" > /dev/null 2>&1
+            STATUS=$?
+        done
+
+        if [ $STATUS -eq 0 ]; then
+            # Don't cache a build that still has unresolved references or outlines
+            if grep -q "Rerun to get" "$LOG_FILE"; then
+                echo -e "${YELLOW}⚠ LaTeX still requests a rerun after $MAX_PASSES passes${NC}"
+            else
+                echo "$CV_HASH" > "$HASH_FILE"
+            fi
+            echo -e "${GREEN}✓ CV compiled successfully${NC}"
+        else
+            echo -e "${RED}✗ Error compiling CV${NC}"
+            if [ $STATUS -eq 127 ]; then
+                echo -e "${RED}pdflatex not found; check that LaTeX is installed and on your PATH${NC}"
+            else
+                # pdflatex output is discarded, so surface the first error from the log
+                grep -m 1 -A 2 "^!" "$LOG_FILE" 2>/dev/null
+            fi
+            exit 1
+        fi
     fi
 else
     echo -e "${RED}Error: $CV_FILE not found${NC}"